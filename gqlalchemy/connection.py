@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 import mgclient
 from neo4j import GraphDatabase
@@ -23,6 +25,7 @@ from neo4j.graph import Relationship as Neo4jRelationship
 
 from gqlalchemy.exceptions import database_error_handler, connection_handler
 from gqlalchemy.models import Node, Path, Relationship
+import gqlalchemy.memgraph_constants as mg_consts
 
 __all__ = ("Connection",)
 
@@ -45,12 +48,12 @@ class Connection(ABC):
         self.client_name = client_name
 
     @abstractmethod
-    def execute(self, query: str, parameters: Dict[str, Any] = {}) -> None:
+    def execute(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
         """Executes Cypher query without returning any results."""
         pass
 
     @abstractmethod
-    def execute_and_fetch(self, query: str, parameters: Dict[str, Any] = {}) -> Iterator[Dict[str, Any]]:
+    def execute_and_fetch(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
         """Executes Cypher query and returns iterator of results."""
         pass
 
@@ -60,6 +63,79 @@ class Connection(ABC):
         pass
 
 
+class _MemgraphPool:
+    """Thread-safe pool of idle mgclient connections.
+
+    Connections are grouped by the arguments they were opened with, so a
+    connection is only handed out to a caller that would have opened an
+    identical one.
+
+    Connections opened by a parent process share their sockets with a forked
+    child, so the child never reuses them. They are kept referenced instead of
+    closed to leave the parent's sessions untouched.
+    """
+
+    def __init__(self, max_idle: int = mg_consts.MG_MAX_IDLE_CONNECTIONS):
+        # Reentrant since MemgraphConnection.__del__ releases into the pool
+        # and the garbage collector can run it while the lock is held.
+        self._lock = threading.RLock()
+        self._idle: Dict[Tuple, List["mgclient.Connection"]] = {}
+        self._max_idle = max_idle
+        self._pid = os.getpid()
+        self._inherited: List[Any] = []
+
+    def _check_fork(self) -> None:
+        """Drops the idle connections inherited from the parent process."""
+        pid = os.getpid()
+        if pid != self._pid:
+            self._inherited.append(self._idle)
+            self._lock = threading.RLock()
+            self._idle = {}
+            self._pid = pid
+
+    def acquire(self, key: Tuple) -> Optional["mgclient.Connection"]:
+        """Returns an idle ready connection for `key` or None if there is none."""
+        self._check_fork()
+        with self._lock:
+            idle = self._idle.get(key)
+            while idle:
+                connection = idle.pop()
+                if connection.status == mgclient.CONN_STATUS_READY:
+                    return connection
+        return None
+
+    def release(self, key: Tuple, connection: "mgclient.Connection", pid: int) -> None:
+        """Puts the connection back to the pool if it can still be used and
+        the pool is not full, otherwise closes it. `pid` is the process that
+        opened the connection.
+        """
+        if pid != os.getpid():
+            self._inherited.append(connection)
+            return
+
+        self._check_fork()
+        if connection.status == mgclient.CONN_STATUS_READY:
+            with self._lock:
+                idle = self._idle.get(key)
+                if idle is None:
+                    idle = self._idle[key] = []
+                if len(idle) < self._max_idle:
+                    idle.append(connection)
+                    return
+        connection.close()
+
+    def clear(self, key: Tuple) -> None:
+        """Closes all idle connections for `key`."""
+        self._check_fork()
+        with self._lock:
+            idle = self._idle.pop(key, [])
+        for connection in idle:
+            connection.close()
+
+
+_memgraph_pool = _MemgraphPool()
+
+
 class MemgraphConnection(Connection):
     def __init__(
         self,
@@ -70,38 +146,97 @@ class MemgraphConnection(Connection):
         encrypted: bool,
         client_name: Optional[str] = None,
         lazy: bool = False,
+        fetch_size: int = mg_consts.MG_FETCH_SIZE,
     ):
         super().__init__(
             host=host, port=port, username=username, password=password, encrypted=encrypted, client_name=client_name
         )
         self.lazy = lazy
+        self.fetch_size = fetch_size
         self._connection = self._create_connection()
+        self._pid = os.getpid()
 
     @database_error_handler
-    def execute(self, query: str, parameters: Dict[str, Any] = {}) -> None:
+    def execute(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
         """Executes Cypher query without returning any results."""
-        cursor = self._connection.cursor()
-        cursor.execute(query, parameters)
+        cursor = self._execute_cursor(query, parameters)
         cursor.fetchall()
 
     @database_error_handler
-    def execute_and_fetch(self, query: str, parameters: Dict[str, Any] = {}) -> Iterator[Dict[str, Any]]:
+    def execute_and_fetch(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
         """Executes Cypher query and returns iterator of results."""
-        cursor = self._connection.cursor()
-        cursor.execute(query, parameters)
+        cursor = self._execute_cursor(query, parameters)
+        columns = tuple(dsc.name for dsc in cursor.description or ())
         while True:
-            row = cursor.fetchone()
-            if row is None:
+            rows = cursor.fetchmany(self.fetch_size)
+            if not rows:
                 break
-            yield {dsc.name: _convert_memgraph_value(row[index]) for index, dsc in enumerate(cursor.description)}
+            for row in rows:
+                yield dict(zip(columns, map(_convert_memgraph_value, row)))
+
+    def _execute_cursor(self, query: str, parameters: Optional[Dict[str, Any]]) -> "mgclient.Cursor":
+        """Executes the query on a new cursor.
+        A pooled connection can be closed by the server while it is idle and
+        mgclient only notices it once a query fails. If the first query on a
+        pooled connection breaks it, the idle connections for the same server
+        are dropped and the query is retried once on a new connection.
+        """
+        try:
+            cursor = self._new_cursor(query, parameters)
+        except mgclient.Error:
+            if not self._reused or self._connection.status == mgclient.CONN_STATUS_READY:
+                raise
+            self._reused = False
+            self._connection.close()
+            _memgraph_pool.clear(self._pool_key)
+            self._connection = self._reconnect()
+            cursor = self._new_cursor(query, parameters)
+
+        self._reused = False
+        return cursor
+
+    def _new_cursor(self, query: str, parameters: Optional[Dict[str, Any]]) -> "mgclient.Cursor":
+        cursor = self._connection.cursor()
+        if parameters:
+            cursor.execute(query, parameters)
+        else:
+            cursor.execute(query)
+        return cursor
 
     def is_active(self) -> bool:
         """Returns True if connection is active and can be used."""
         return self._connection is not None and self._connection.status == mgclient.CONN_STATUS_READY
 
+    def close(self) -> None:
+        """Returns the underlying connection to the pool so it can be reused."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            _memgraph_pool.release(self._pool_key, connection, self._pid)
+
+    def __del__(self):
+        if getattr(self, "_connection", None) is not None:
+            self.close()
+
+    @property
+    def _pool_key(self) -> Tuple:
+        return (self.host, self.port, self.username, self.password, self.encrypted, self.client_name, self.lazy)
+
     @connection_handler
     def _create_connection(self) -> Connection:
-        """Creates and returns a connection with Memgraph."""
+        """Returns a pooled connection with Memgraph or creates a new one."""
+        connection = _memgraph_pool.acquire(self._pool_key)
+        self._reused = connection is not None
+        if connection is not None:
+            return connection
+
+        return self._connect()
+
+    @connection_handler
+    def _reconnect(self) -> Connection:
+        """Creates a new connection with Memgraph, bypassing the pool."""
+        return self._connect()
+
+    def _connect(self) -> Connection:
         sslmode = mgclient.MG_SSLMODE_REQUIRE if self.encrypted else mgclient.MG_SSLMODE_DISABLE
         connection = mgclient.connect(
             host=self.host,
@@ -116,37 +251,67 @@ class MemgraphConnection(Connection):
         return connection
 
 
-def _convert_memgraph_value(value: Any) -> Any:
-    """Converts Memgraph objects to custom Node/Relationship objects."""
-    if isinstance(value, mgclient.Relationship):
-        return Relationship.parse_obj(
-            {
-                "_type": value.type,
-                "_id": value.id,
-                "_start_node_id": value.start_id,
-                "_end_node_id": value.end_id,
-                **value.properties,
-            }
-        )
+# Result nodes share a small set of label combinations, so each combination is
+# stored once and reused as the node labels and the class resolution cache key.
+_LABELS_INTERN: Dict[Tuple[str, ...], FrozenSet[str]] = {}
 
-    if isinstance(value, mgclient.Node):
-        return Node.parse_obj(
-            {
-                "_id": value.id,
-                "_labels": set(value.labels),
-                **value.properties,
-            }
-        )
 
-    if isinstance(value, mgclient.Path):
-        return Path.parse_obj(
-            {
-                "_nodes": list([_convert_memgraph_value(node) for node in value.nodes]),
-                "_relationships": list([_convert_memgraph_value(rel) for rel in value.relationships]),
-            }
-        )
+def _intern_labels(labels: Iterable[str]) -> FrozenSet[str]:
+    """Returns a shared frozenset for the given labels."""
+    key = tuple(sorted(labels))
+    interned = _LABELS_INTERN.get(key)
+    if interned is None:
+        interned = _LABELS_INTERN.setdefault(key, frozenset(key))
+
+    return interned
+
+
+def _convert_memgraph_relationship(value: "mgclient.Relationship") -> Relationship:
+    return Relationship.parse_obj(
+        {
+            "_type": value.type,
+            "_id": value.id,
+            "_start_node_id": value.start_id,
+            "_end_node_id": value.end_id,
+            **value.properties,
+        }
+    )
+
+
+def _convert_memgraph_node(value: "mgclient.Node") -> Node:
+    return Node.parse_obj(
+        {
+            "_id": value.id,
+            "_labels": _intern_labels(value.labels),
+            **value.properties,
+        }
+    )
+
+
+def _convert_memgraph_path(value: "mgclient.Path") -> Path:
+    return Path.parse_obj(
+        {
+            "_nodes": tuple(map(_convert_memgraph_node, value.nodes)),
+            "_relationships": tuple(map(_convert_memgraph_relationship, value.relationships)),
+        }
+    )
 
-    return value
+
+# mgclient graph types can't be subclassed, so an exact type lookup replaces the isinstance chain.
+_MEMGRAPH_CONVERTERS = {
+    mgclient.Relationship: _convert_memgraph_relationship,
+    mgclient.Node: _convert_memgraph_node,
+    mgclient.Path: _convert_memgraph_path,
+}
+
+
+def _convert_memgraph_value(value: Any) -> Any:
+    """Converts Memgraph objects to custom Node/Relationship objects."""
+    converter = _MEMGRAPH_CONVERTERS.get(type(value))
+    if converter is None:
+        return value
+
+    return converter(value)
 
 
 class Neo4jConnection(Connection):
@@ -159,25 +324,32 @@ class Neo4jConnection(Connection):
         encrypted: bool,
         client_name: Optional[str] = None,
         lazy: bool = True,
+        fetch_size: int = 1000,
     ):
         super().__init__(
             host=host, port=port, username=username, password=password, encrypted=encrypted, client_name=client_name
         )
         self.lazy = lazy
+        self.fetch_size = fetch_size
         self._connection = self._create_connection()
 
-    def execute(self, query: str, parameters: Dict[str, Any] = {}) -> None:
+    def execute(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> None:
         """Executes Cypher query without returning any results."""
         with self._connection.session() as session:
             session.run(query, parameters)
 
-    def execute_and_fetch(self, query: str, parameters: Dict[str, Any] = {}) -> Iterator[Dict[str, Any]]:
-        """Executes Cypher query and returns iterator of results."""
+    def execute_and_fetch(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """Executes Cypher query and returns iterator of results.
+
+        Records are streamed from the server in batches of `fetch_size`. Returning
+        scalar properties instead of whole nodes and relationships keeps the
+        driver from building graph objects for every record.
+        """
         with self._connection.session() as session:
             results = session.run(query, parameters)
             columns = results.keys()
             for result in results:
-                yield {column: _convert_neo4j_value(result[column]) for column in columns}
+                yield dict(zip(columns, map(_convert_neo4j_value, result.values())))
 
     def is_active(self) -> bool:
         """Returns True if connection is active and can be used."""
@@ -185,38 +357,58 @@ class Neo4jConnection(Connection):
 
     def _create_connection(self):
         return GraphDatabase.driver(
-            f"bolt://{self.host}:{self.port}", auth=(self.username, self.password), encrypted=self.encrypted
+            f"bolt://{self.host}:{self.port}",
+            auth=(self.username, self.password),
+            encrypted=self.encrypted,
+            fetch_size=self.fetch_size,
         )
 
 
+def _convert_neo4j_relationship(value: Neo4jRelationship) -> Relationship:
+    return Relationship.parse_obj(
+        {
+            "_type": value.type,
+            "_id": value.id,
+            "_start_node_id": value.start_node.id,
+            "_end_node_id": value.end_node.id,
+            **dict(value.items()),
+        }
+    )
+
+
+def _convert_neo4j_node(value: Neo4jNode) -> Node:
+    return Node.parse_obj(
+        {
+            "_id": value.id,
+            "_labels": _intern_labels(value.labels),
+            **dict(value.items()),
+        }
+    )
+
+
+def _convert_neo4j_path(value: Neo4jPath) -> Path:
+    return Path.parse_obj(
+        {
+            "_nodes": tuple(map(_convert_neo4j_node, value.nodes)),
+            "_relationships": tuple(map(_convert_neo4j_relationship, value.relationships)),
+        }
+    )
+
+
+_NEO4J_CONVERTERS = {
+    Neo4jNode: _convert_neo4j_node,
+    Neo4jPath: _convert_neo4j_path,
+}
+
+
 def _convert_neo4j_value(value: Any) -> Any:
     """Converts Neo4j objects to custom Node/Relationship objects."""
-    if isinstance(value, Neo4jRelationship):
-        return Relationship.parse_obj(
-            {
-                "_type": value.type,
-                "_id": value.id,
-                "_start_node_id": value.start_node.id,
-                "_end_node_id": value.end_node.id,
-                **dict(value.items()),
-            }
-        )
+    converter = _NEO4J_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
 
-    if isinstance(value, Neo4jNode):
-        return Node.parse_obj(
-            {
-                "_id": value.id,
-                "_labels": set(value.labels),
-                **dict(value.items()),
-            }
-        )
-
-    if isinstance(value, Neo4jPath):
-        return Path.parse_obj(
-            {
-                "_nodes": list([_convert_neo4j_value(node) for node in value.nodes]),
-                "_relationships": list([_convert_neo4j_value(rel) for rel in value.relationships]),
-            }
-        )
+    # The Neo4j driver creates a Relationship subclass for every relationship type.
+    if isinstance(value, Neo4jRelationship):
+        return _convert_neo4j_relationship(value)
 
     return value
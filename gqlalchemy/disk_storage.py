@@ -15,7 +15,7 @@
 import sqlite3
 import contextlib
 from abc import ABC
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Sequence, Tuple
 
 
 class OnDiskPropertyDatabase(ABC):
@@ -25,6 +25,11 @@ class OnDiskPropertyDatabase(ABC):
         """Saves a node property to an on disk database."""
         pass
 
+    def save_node_properties(self, node_id: int, properties: Dict[str, Any]) -> None:
+        """Saves multiple properties of a node to an on disk database."""
+        for property_name, property_value in properties.items():
+            self.save_node_property(node_id, property_name, property_value)
+
     def load_node_property(self, node_id: int, property_name: str, property_value: str) -> Optional[str]:
         """Loads a node property from an on disk database."""
         pass
@@ -37,6 +42,11 @@ class OnDiskPropertyDatabase(ABC):
         """Saves a relationship property to an on disk database."""
         pass
 
+    def save_relationship_properties(self, relationship_id: int, properties: Dict[str, Any]) -> None:
+        """Saves multiple properties of a relationship to an on disk database."""
+        for property_name, property_value in properties.items():
+            self.save_relationship_property(relationship_id, property_name, property_value)
+
     def load_relationship_property(
         self, relationship_id: int, property_name: str, property_value: str
     ) -> Optional[str]:
@@ -75,6 +85,18 @@ class SQLitePropertyDatabase(OnDiskPropertyDatabase):
                     cursor.execute(query)
                     return cursor.fetchall()
 
+    def execute_many(self, query: str, rows: Sequence[Tuple]) -> None:
+        """Executes a parameterized SQL query once for every row in a single
+        transaction.
+
+        Args:
+            query: A string representing an SQL query with `?` placeholders.
+            rows: A sequence of tuples with the values for the placeholders.
+        """
+        with contextlib.closing(sqlite3.connect(self.database_name)) as conn:
+            with conn:  # commit all rows at once
+                conn.executemany(query, rows)
+
     def _create_node_property_table(self) -> None:
         """Creates a node property SQL table."""
         self.execute_query(
@@ -117,6 +139,22 @@ class SQLitePropertyDatabase(OnDiskPropertyDatabase):
             "DO UPDATE SET property_value=excluded.property_value;"
         )
 
+    def save_node_properties(self, node_id: int, properties: Dict[str, Any]) -> None:
+        """Saves multiple node properties to an on disk database in a single
+        transaction.
+
+        Args:
+            node_id: An integer representing the internal id of the node.
+            properties: A dictionary mapping property names to property values.
+        """
+        self.execute_many(
+            "INSERT INTO node_properties (node_id, property_name, property_value) "
+            "VALUES(?, ?, ?) "
+            "ON CONFLICT(node_id, property_name) "
+            "DO UPDATE SET property_value=excluded.property_value;",
+            [(node_id, property_name, str(property_value)) for property_name, property_value in properties.items()],
+        )
+
     def load_node_property(self, node_id: int, property_name: str) -> Optional[str]:
         """Loads a node property from an on disk database.
 
@@ -171,6 +209,25 @@ class SQLitePropertyDatabase(OnDiskPropertyDatabase):
             "DO UPDATE SET property_value=excluded.property_value;"
         )
 
+    def save_relationship_properties(self, relationship_id: int, properties: Dict[str, Any]) -> None:
+        """Saves multiple relationship properties to an on disk database in a
+        single transaction.
+
+        Args:
+            relationship_id: An integer representing the internal id of the relationship.
+            properties: A dictionary mapping property names to property values.
+        """
+        self.execute_many(
+            "INSERT INTO relationship_properties (relationship_id, property_name, property_value) "
+            "VALUES(?, ?, ?) "
+            "ON CONFLICT(relationship_id, property_name) "
+            "DO UPDATE SET property_value=excluded.property_value;",
+            [
+                (relationship_id, property_name, str(property_value))
+                for property_name, property_value in properties.items()
+            ],
+        )
+
     def load_relationship_property(self, relationship_id: int, property_name: str) -> Optional[str]:
         """Loads a relationship property from an on disk database.
 
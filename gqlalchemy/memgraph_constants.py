@@ -7,3 +7,5 @@ MG_PASSWORD = os.getenv("MG_PASSWORD", "")
 MG_ENCRYPTED = os.getenv("MG_ENCRYPT", "false").lower() == "true"
 MG_CLIENT_NAME = os.getenv("MG_CLIENT_NAME", "GQLAlchemy")
 MG_LAZY = os.getenv("MG_LAZY", "false").lower() == "true"
+MG_FETCH_SIZE = int(os.getenv("MG_FETCH_SIZE", "1000"))
+MG_MAX_IDLE_CONNECTIONS = int(os.getenv("MG_MAX_IDLE_CONNECTIONS", "8"))
@@ -17,7 +17,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, date, time, timedelta
 from enum import Enum
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from pydantic.v1 import BaseModel, Extra, Field, PrivateAttr  # noqa F401
 
@@ -46,31 +46,120 @@ datetimeKwMapping = {
     date: DatetimeKeywords.DATE.value,
 }
 
+_DURATION_KW = DatetimeKeywords.DURATION.value
+_LOCALTIME_KW = DatetimeKeywords.LOCALTIME.value
+_LOCALDATETIME_KW = DatetimeKeywords.LOCALDATETIME.value
+_DATE_KW = DatetimeKeywords.DATE.value
+
+
+def _escape_quotes(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
 
 def _format_timedelta(duration: timedelta) -> str:
-    days = int(duration.total_seconds() // 86400)
-    remainder_sec = duration.total_seconds() - days * 86400
-    hours = int(remainder_sec // 3600)
-    remainder_sec -= hours * 3600
-    minutes = int(remainder_sec // 60)
-    remainder_sec -= minutes * 60
+    total_microseconds = (duration.days * 86400 + duration.seconds) * 1_000_000 + duration.microseconds
+    days, remainder = divmod(total_microseconds, 86_400_000_000)
+    hours, remainder = divmod(remainder, 3_600_000_000)
+    minutes, remainder = divmod(remainder, 60_000_000)
+    seconds, microseconds = divmod(remainder, 1_000_000)
+    fraction = f"{microseconds:06d}".rstrip("0") or "0"
+
+    return f"P{days}DT{hours}H{minutes}M{seconds}.{fraction}S"
+
+
+def _escape_str(value: str) -> str:
+    return repr(value) if value.isprintable() else rf"'{value}'"
+
+
+def _escape_list(value: list) -> str:
+    return "[" + ", ".join(map(_escape_value, value)) + "]"
+
+
+def _escape_dict(value: dict) -> str:
+    return "{" + ", ".join(f"{key}: {_escape_value(val)}" for key, val in value.items()) + "}"
+
 
-    return f"P{days}DT{hours}H{minutes}M{remainder_sec}S"
+def _escape_datetime(value: datetime) -> str:
+    if value.tzinfo is not None:
+        tz_offset = value.strftime("%z")
+        tz_name = value.tzinfo.zone
+        return f"datetime('{value.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}[{tz_name}]')"
+    return f"{_LOCALDATETIME_KW}('{value.isoformat()}')"
+
+
+def _escape_timedelta(value: timedelta) -> str:
+    return f"{_DURATION_KW}('{_format_timedelta(value)}')"
+
+
+def _escape_date(value: date) -> str:
+    return f"{_DATE_KW}('{value.isoformat()}')"
+
+
+def _escape_time(value: time) -> str:
+    return f"{_LOCALTIME_KW}('{value.isoformat()}')"
+
+
+_ESCAPERS = {
+    type(None): lambda value: "Null",
+    bool: repr,
+    int: repr,
+    float: repr,
+    str: _escape_str,
+    list: _escape_list,
+    dict: _escape_dict,
+    datetime: _escape_datetime,
+    timedelta: _escape_timedelta,
+    date: _escape_date,
+    time: _escape_time,
+}
+
+# Checked in order for subclasses of the supported types, datetime before its base class date.
+_SUBCLASS_ESCAPERS = (
+    (str, _escape_str),
+    (list, _escape_list),
+    (datetime, _escape_datetime),
+    (timedelta, _escape_timedelta),
+    (date, _escape_date),
+    (time, _escape_time),
+)
 
 
-class TriggerEventType:
+def _escape_value(value: Union[None, bool, int, float, str, list, dict, datetime, timedelta, date, time]) -> str:
+    """Converts a property value to its Cypher literal."""
+    escaper = _ESCAPERS.get(type(value))
+    if escaper is not None:
+        return escaper(value)
+
+    for value_type, escaper in _SUBCLASS_ESCAPERS:
+        if isinstance(value, value_type):
+            return escaper(value)
+
+    raise GQLAlchemyError(
+        f"Unsupported value data type: {type(value)}."
+        + " Memgraph supports the following data types:"
+        + " None, bool, int, float, str, list, dict, datetime."
+    )
+
+
+class _StrEnum(str, Enum):
+    """A string enum whose members format as their plain values."""
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec: str) -> str:
+        return self.value.__format__(format_spec)
+
+
+class TriggerEventType(_StrEnum):
     """An enum representing types of trigger events."""
 
     CREATE = "CREATE"
     UPDATE = "UPDATE"
     DELETE = "DELETE"
 
-    @classmethod
-    def list(cls):
-        return [cls.CREATE, cls.UPDATE, cls.DELETE]
 
-
-class TriggerEventObject:
+class TriggerEventObject(_StrEnum):
     """An enum representing types of trigger objects.
 
     NODE -> `()`
@@ -80,12 +169,8 @@ class TriggerEventObject:
     NODE = "()"
     RELATIONSHIP = "-->"
 
-    @classmethod
-    def list(cls):
-        return [cls.NODE, cls.RELATIONSHIP]
 
-
-class TriggerExecutionPhase:
+class TriggerExecutionPhase(_StrEnum):
     """An enum representing types of trigger objects.
 
     Enum:
@@ -97,6 +182,14 @@ class TriggerExecutionPhase:
     AFTER = "AFTER"
 
 
+# The `ON ...` fragment of a trigger for every valid event type and object.
+_TRIGGER_ON_CLAUSES = {
+    (event_type, event_object): f"ON {event_object} {event_type} " if event_object else f"ON {event_type} "
+    for event_type in TriggerEventType
+    for event_object in (*TriggerEventObject, None)
+}
+
+
 class FieldAttrsConstants:
     INDEX = "index"
     EXISTS = "exists"
@@ -179,16 +272,19 @@ class Neo4jConstraintExists(Constraint):
 
 
 @dataclass(frozen=True, eq=True)
-class MemgraphStream(ABC):
+class MemgraphStream:
     name: str
     topics: List[str]
     transform: str
 
-    @abstractmethod
+    def __post_init__(self):
+        object.__setattr__(self, "_topics_csv", ",".join(self.topics))
+
     def to_cypher(self) -> str:
-        pass
+        raise NotImplementedError
 
 
+@dataclass(frozen=True, eq=True)
 class MemgraphKafkaStream(MemgraphStream):
     """A class for creating and managing Kafka streams in Memgraph.
 
@@ -197,47 +293,33 @@ class MemgraphKafkaStream(MemgraphStream):
         topics: A list of strings representing the stream topics.
         transform: A string representing the name of the transformation procedure.
         consumer_group: A string representing the consumer group.
-        name: A string representing the batch interval.
-        name: A string representing the batch size.
-        name: A string or list of strings representing bootstrap server addresses.
+        batch_interval: A string representing the batch interval.
+        batch_size: A string representing the batch size.
+        bootstrap_servers: A string or list of strings representing bootstrap server addresses.
     """
 
-    def __init__(
-        self,
-        name: str,
-        topics: List[str],
-        transform: str,
-        consumer_group: str = None,
-        batch_interval: str = None,
-        batch_size: str = None,
-        bootstrap_servers: Union[str, List[str]] = None,
-    ):
-        super().__init__(name, topics, transform)
-        self.consumer_group = consumer_group
-        self.batch_interval = batch_interval
-        self.batch_size = batch_size
-        self.bootstrap_servers = bootstrap_servers
+    consumer_group: Optional[str] = None
+    batch_interval: Optional[str] = None
+    batch_size: Optional[str] = None
+    bootstrap_servers: Optional[Union[str, List[str]]] = None
 
     def to_cypher(self) -> str:
         """Converts Kafka stream to a Cypher clause."""
-        topics = ",".join(self.topics)
-        query = f"CREATE KAFKA STREAM {self.name} TOPICS {topics} TRANSFORM {self.transform}"
+        parts = [f"CREATE KAFKA STREAM {self.name} TOPICS {self._topics_csv} TRANSFORM {self.transform}"]
         if self.consumer_group is not None:
-            query += f" CONSUMER_GROUP {self.consumer_group}"
+            parts.append(f"CONSUMER_GROUP {self.consumer_group}")
         if self.batch_interval is not None:
-            query += f" BATCH_INTERVAL {self.batch_interval}"
+            parts.append(f"BATCH_INTERVAL {self.batch_interval}")
         if self.batch_size is not None:
-            query += f" BATCH_SIZE {self.batch_size}"
+            parts.append(f"BATCH_SIZE {self.batch_size}")
         if self.bootstrap_servers is not None:
-            if isinstance(self.bootstrap_servers, str):
-                servers_field = f"'{self.bootstrap_servers}'"
-            else:
-                servers_field = str(self.bootstrap_servers)[1:-1]
-            query += f" BOOTSTRAP_SERVERS {servers_field}"
-        query += ";"
-        return query
+            servers = [self.bootstrap_servers] if isinstance(self.bootstrap_servers, str) else self.bootstrap_servers
+            servers_field = ", ".join(f"'{_escape_quotes(server)}'" for server in servers)
+            parts.append(f"BOOTSTRAP_SERVERS {servers_field}")
+        return " ".join(parts) + ";"
 
 
+@dataclass(frozen=True, eq=True)
 class MemgraphPulsarStream(MemgraphStream):
     """A class for creating and managing Pulsar streams in Memgraph.
 
@@ -245,38 +327,25 @@ class MemgraphPulsarStream(MemgraphStream):
         name: A string representing the stream name.
         topics: A list of strings representing the stream topics.
         transform: A string representing the name of the transformation procedure.
-        consumer_group: A string representing the consumer group.
-        name: A string representing the batch interval.
-        name: A string representing the batch size.
-        name: A string or list of strings representing bootstrap server addresses.
+        batch_interval: A string representing the batch interval.
+        batch_size: A string representing the batch size.
+        service_url: A string representing the Pulsar service URL.
     """
 
-    def __init__(
-        self,
-        name: str,
-        topics: List[str],
-        transform: str,
-        batch_interval: str = None,
-        batch_size: str = None,
-        service_url: str = None,
-    ):
-        super().__init__(name, topics, transform)
-        self.batch_interval = batch_interval
-        self.batch_size = batch_size
-        self.service_url = service_url
+    batch_interval: Optional[str] = None
+    batch_size: Optional[str] = None
+    service_url: Optional[str] = None
 
     def to_cypher(self) -> str:
         """Converts Pulsar stream to a Cypher clause."""
-        topics = ",".join(self.topics)
-        query = f"CREATE PULSAR STREAM {self.name} TOPICS {topics} TRANSFORM {self.transform}"
+        parts = [f"CREATE PULSAR STREAM {self.name} TOPICS {self._topics_csv} TRANSFORM {self.transform}"]
         if self.batch_interval is not None:
-            query += f" BATCH_INTERVAL {self.batch_interval}"
+            parts.append(f"BATCH_INTERVAL {self.batch_interval}")
         if self.batch_size is not None:
-            query += f" BATCH_SIZE {self.batch_size}"
+            parts.append(f"BATCH_SIZE {self.batch_size}")
         if self.service_url is not None:
-            query += f" SERVICE_URL {self.service_url}"
-        query += ";"
-        return query
+            parts.append(f"SERVICE_URL {self.service_url}")
+        return " ".join(parts) + ";"
 
 
 @dataclass(frozen=True, eq=True)
@@ -287,22 +356,25 @@ class MemgraphTrigger:
     event_type: Optional[TriggerEventType] = None
     event_object: Optional[TriggerEventObject] = None
 
+    def __post_init__(self):
+        # The trigger is frozen, so its Cypher clause can be built once.
+        object.__setattr__(self, "_cypher", self._build_cypher())
+
     def to_cypher(self) -> str:
         """Converts a Trigger to a cypher clause."""
-        query = f"CREATE TRIGGER {self.name} "
-        if self.event_type in TriggerEventType.list():
-            query += f"ON " + (
-                f"{self.event_object} {self.event_type} "
-                if self.event_object in TriggerEventObject.list()
-                else f"{self.event_type} "
-            )
-        query += f"{self.execution_phase} COMMIT EXECUTE "
-        query += f"{self.statement};"
-        return query
+        return self._cypher
+
+    def _build_cypher(self) -> str:
+        on_clause = _TRIGGER_ON_CLAUSES.get((self.event_type, self.event_object))
+        if on_clause is None:
+            # Unknown event objects are left out, as are unknown event types.
+            on_clause = _TRIGGER_ON_CLAUSES.get((self.event_type, None), "")
+        return f"CREATE TRIGGER {self.name} {on_clause}{self.execution_phase} COMMIT EXECUTE {self.statement};"
 
 
 class GraphObject(BaseModel):
     _subtypes_: Dict = dict()
+    _node_classes_by_labels_: Dict = dict()
 
     class Config:
         extra = Extra.allow
@@ -318,6 +390,18 @@ class GraphObject(BaseModel):
         else:
             cls._subtypes_[cls.__name__] = cls
 
+        GraphObject._node_classes_by_labels_.clear()
+
+        # Fields that are stored in the on disk property database and fields that are written to the graph database.
+        cls._on_disk_fields = tuple(
+            field for field, model_field in cls.__fields__.items() if model_field.field_info.extra.get("on_disk", False)
+        )
+        cls._cypher_set_fields = tuple(
+            field
+            for field, model_field in cls.__fields__.items()
+            if not model_field.field_info.extra.get("on_disk", False)
+        )
+
     @classmethod
     def __get_validators__(cls):
         yield cls._convert_to_real_type_
@@ -333,14 +417,9 @@ class GraphObject(BaseModel):
             sub = cls._subtypes_.get(data.get("_type"))
 
         if "_labels" in data:  # Node
-            # Find class that has the most super classes
-            labels = data["_labels"]
-            classes = [cls._subtypes_[label] for label in labels if label in cls._subtypes_]
-            counter = defaultdict(int)
-            for class1 in classes:
-                counter[class1] += sum(issubclass(class1, class2) for class2 in classes)
-            if counter:
-                sub = max(counter, key=counter.get)
+            node_class = GraphObject._get_node_class_by_labels(frozenset(data["_labels"]))
+            if node_class is not None:
+                sub = node_class
 
         if sub is None:
             types = data.get("_type", data.get("_labels"))
@@ -351,6 +430,26 @@ class GraphObject(BaseModel):
 
         return sub(**data)
 
+    @staticmethod
+    def _get_node_class_by_labels(labels: FrozenSet[str]) -> Optional[type]:
+        """Returns the registered class that has the most super classes among
+        the classes registered for `labels`, or None if no label is registered.
+        The result is cached until a new subclass is registered.
+        """
+        cache = GraphObject._node_classes_by_labels_
+        try:
+            return cache[labels]
+        except KeyError:
+            pass
+
+        subtypes = GraphObject._subtypes_
+        classes = [subtypes[label] for label in labels if label in subtypes]
+        counter = defaultdict(int)
+        for class1 in classes:
+            counter[class1] += sum(issubclass(class1, class2) for class2 in classes)
+
+        return cache.setdefault(labels, max(counter, key=counter.get) if counter else None)
+
     @classmethod
     def parse_obj(cls, obj):
         """Used to convert a dictionary object into the appropriate
@@ -361,45 +460,7 @@ class GraphObject(BaseModel):
     def escape_value(
         self, value: Union[None, bool, int, float, str, list, dict, datetime, timedelta, date, time]
     ) -> str:
-        value_type = type(value)
-
-        if value is None:
-            "Null"
-        elif value_type == bool:
-            return repr(value)
-        elif value_type == int:
-            return repr(value)
-        elif value_type == float:
-            return repr(value)
-        elif isinstance(value, str):
-            return repr(value) if value.isprintable() else rf"'{value}'"
-        elif isinstance(value, list):
-            return "[" + ", ".join(self.escape_value(val) for val in value) + "]"
-        elif value_type == dict:
-            return "{" + ", ".join(f"{key}: {self.escape_value(val)}" for key, val in value.items()) + "}"
-
-        if isinstance(value, datetime):
-            if value.tzinfo is not None:
-                tz_offset = value.strftime("%z")
-                tz_name = value.tzinfo.zone
-                return f"datetime('{value.strftime('%Y-%m-%dT%H:%M:%S')}{tz_offset}[{tz_name}]')"
-            keyword = datetimeKwMapping[datetime]
-            formatted_value = value.isoformat()
-            return f"{keyword}('{formatted_value}')"
-        elif isinstance(value, timedelta):
-            formatted_value = _format_timedelta(value)
-            keyword = datetimeKwMapping[timedelta]
-            return f"{keyword}('{formatted_value}')"
-        elif isinstance(value, (time, date)):
-            formatted_value = value.isoformat()
-            keyword = datetimeKwMapping[type(value)]
-            return f"{keyword}('{formatted_value}')"
-        else:
-            raise GQLAlchemyError(
-                f"Unsupported value data type: {type(value)}."
-                + " Memgraph supports the following data types:"
-                + " None, bool, int, float, str, list, dict, datetime."
-            )
+        return _escape_value(value)
 
     def _get_cypher_field_assignment_block(self, variable_name: str, operator: str) -> str:
         """Creates a cypher field assignment block joined using the `operator`
@@ -443,14 +504,24 @@ class GraphObject(BaseModel):
     def _get_cypher_set_properties(self, variable_name: str) -> str:
         """Returns a cypher set properties block."""
         cypher_set_properties = []
-        for field in self.__fields__:
-            attributes = self.__fields__[field].field_info.extra
+        for field in type(self)._cypher_set_fields:
             value = getattr(self, field)
-            if value is not None and not attributes.get("on_disk", False):
+            if value is not None:
                 cypher_set_properties.append(f" SET {variable_name}.{field} = {self.escape_value(value)}")
 
         return " " + " ".join(cypher_set_properties) + " "
 
+    def _get_cypher_set_map(self) -> str:
+        """Returns the values set by `_get_cypher_set_properties` as a cypher
+        map, so they can be assigned at once with `SET variable += map`.
+        """
+        values = ((field, getattr(self, field)) for field in type(self)._cypher_set_fields)
+        return (
+            "{"
+            + ", ".join(f"{field}: {self.escape_value(value)}" for field, value in values if value is not None)
+            + "}"
+        )
+
     def __str__(self) -> str:
         return "<GraphObject>"
 
@@ -469,7 +540,7 @@ class UniqueGraphObject(GraphObject):
 
     @property
     def _properties(self) -> Dict[str, Any]:
-        return {k: v for k, v in dict(self).items() if not k.startswith("_") and k != "labels"}
+        return {k: v for k, v in self.__dict__.items() if not k.startswith("_") and k != "labels"}
 
     def __str__(self) -> str:
         return f"<GraphObject id={self._id} properties={self._properties}>"
@@ -509,6 +580,7 @@ class NodeMetaclass(BaseModel.__class__):
         cls.label = kwargs.get("label", name)
         if name != "Node":
             cls.labels = get_base_labels().union({cls.label}, kwargs.get("labels", set()))
+            cls._labels_str = ":".join(sorted(cls.labels))
 
         db = kwargs.get("db")
         if cls.index is True:
@@ -559,6 +631,12 @@ class NodeMetaclass(BaseModel.__class__):
             if attrs and "db" in attrs:
                 del attrs["db"]
 
+        cls._unique_fields = tuple(
+            field
+            for field, model_field in cls.__fields__.items()
+            if FieldAttrsConstants.UNIQUE in model_field.field_info.extra
+        )
+
         return cls
 
 
@@ -570,38 +648,27 @@ class Node(UniqueGraphObject, metaclass=NodeMetaclass):
         self._labels = data.get("_labels", getattr(type(self), "labels", {"Node"}))
 
     def __str__(self) -> str:
-        return "".join(
-            (
-                f"<{type(self).__name__}",
-                f" id={self._id}",
-                f" labels={self._labels}",
-                f" properties={self._properties}",
-                ">",
-            )
-        )
+        return f"<{type(self).__name__} id={self._id} labels={self._labels} properties={self._properties}>"
 
     def _get_cypher_unique_fields_or_block(self, variable_name: str) -> str:
         """Get's a cypher assignment block using the unique fields."""
         cypher_unique_fields = []
-        for field in self.__fields__:
-            attrs = self.__fields__[field].field_info.extra
-            if "unique" in attrs:
-                value = getattr(self, field)
-                if value is not None:
-                    cypher_unique_fields.append(f"{variable_name}.{field} = {self.escape_value(value)}")
+        for field in type(self)._unique_fields:
+            value = getattr(self, field)
+            if value is not None:
+                cypher_unique_fields.append(f"{variable_name}.{field} = {self.escape_value(value)}")
 
         return " " + " OR ".join(cypher_unique_fields) + " "
 
     def has_unique_fields(self) -> bool:
         """Returns True if the Node has any unique fields."""
-        for field in self.__fields__:
-            if "unique" in self.__fields__[field].field_info.extra:
-                if getattr(self, field) is not None:
-                    return True
-        return False
+        return any(getattr(self, field) is not None for field in type(self)._unique_fields)
 
     @property
     def _label(self) -> str:
+        if self._labels is getattr(type(self), "labels", None):
+            return type(self)._labels_str
+
         return ":".join(sorted(self._labels))
 
     def save(self, db: "Database") -> "Node":  # noqa F821
@@ -635,6 +702,27 @@ class Node(UniqueGraphObject, metaclass=NodeMetaclass):
         self._id = node._id
         return self
 
+    @classmethod
+    def save_many(cls, db: "Database", nodes: List["Node"]) -> List["Node"]:  # noqa F821
+        """Saves nodes to Memgraph like `save` does, writing nodes that have
+        an id or no unique fields in batched queries.
+        """
+        for node, result in zip(nodes, db.save_nodes(nodes)):
+            for field in node.__fields__:
+                setattr(node, field, getattr(result, field))
+        return nodes
+
+    @classmethod
+    def load_many(cls, db: "Database", nodes: List["Node"]) -> List["Node"]:  # noqa F821
+        """Loads nodes from Memgraph like `load` does, fetching nodes that
+        have an id in batched queries.
+        """
+        for node, result in zip(nodes, db.load_nodes(nodes)):
+            for field in node.__fields__:
+                setattr(node, field, getattr(result, field))
+            node._id = result._id
+        return nodes
+
     def get_or_create(self, db: "Database") -> Tuple["Node", bool]:  # noqa F821
         """Return the node and a flag for whether it was created in the database.
 
@@ -662,6 +750,8 @@ class RelationshipMetaclass(BaseModel.__class__):
         if name != "Relationship":
             cls.type = kwargs.get("type", name)
 
+        cls._field_names = tuple(cls.__fields__)
+
         return cls
 
 
@@ -681,17 +771,10 @@ class Relationship(UniqueGraphObject, metaclass=RelationshipMetaclass):
         return (self._start_node_id, self._end_node_id)
 
     def __str__(self) -> str:
-        return "".join(
-            (
-                f"<{type(self).__name__}",
-                f" id={self._id}",
-                f" start_node_id={self._start_node_id}",
-                f" end_node_id={self._end_node_id}",
-                f" nodes={self._nodes}",
-                f" type={self._type}",
-                f" properties={self._properties}",
-                ">",
-            )
+        return (
+            f"<{type(self).__name__} id={self._id} start_node_id={self._start_node_id}"
+            f" end_node_id={self._end_node_id} nodes={self._nodes} type={self._type}"
+            f" properties={self._properties}>"
         )
 
     def save(self, db: "Database") -> "Relationship":  # noqa F821
@@ -703,11 +786,21 @@ class Relationship(UniqueGraphObject, metaclass=RelationshipMetaclass):
         relationship, use `load_relationship` first.
         """
         relationship = db.save_relationship(self)
-        for field in self.__fields__:
+        for field in type(self)._field_names:
             setattr(self, field, getattr(relationship, field))
         self._id = relationship._id
         return self
 
+    @classmethod
+    def save_many(cls, db: "Database", relationships: List["Relationship"]) -> List["Relationship"]:  # noqa F821
+        """Saves relationships to Memgraph like `save` does, writing
+        relationships of the same type in batched queries.
+        """
+        for relationship, result in zip(relationships, db.save_relationships(relationships)):
+            for field in type(relationship)._field_names:
+                setattr(relationship, field, getattr(result, field))
+        return relationships
+
     def load(self, db: "Database") -> "Relationship":  # noqa F821
         """Returns a relationship loaded from Memgraph.
         If the relationship._id is not None it fetches the relationship from
@@ -719,8 +812,13 @@ class Relationship(UniqueGraphObject, metaclass=RelationshipMetaclass):
         multiple relationships like that in Memgraph, throws GQLAlchemyError.
         """
         relationship = db.load_relationship(self)
-        for field in self.__fields__:
-            setattr(self, field, getattr(relationship, field))
+        if type(relationship) is type(self):
+            # The loaded relationship is already validated, so copy its state in bulk.
+            self.__dict__.update(relationship.__dict__)
+            self.__fields_set__.update(relationship.__fields_set__)
+        else:
+            for field in type(self)._field_names:
+                setattr(self, field, getattr(relationship, field))
         self._id = relationship._id
         return self
 
@@ -742,19 +840,13 @@ class Relationship(UniqueGraphObject, metaclass=RelationshipMetaclass):
 
 
 class Path(GraphObject):
-    _nodes: Iterable[Node] = PrivateAttr()
-    _relationships: Iterable[Relationship] = PrivateAttr()
+    _nodes: Tuple[Node, ...] = PrivateAttr()
+    _relationships: Tuple[Relationship, ...] = PrivateAttr()
 
     def __init__(self, **data):
         super().__init__(**data)
-        self._nodes = data.get("_nodes")
-        self._relationships = data.get("_relationships")
+        self._nodes = tuple(data.get("_nodes", ()))
+        self._relationships = tuple(data.get("_relationships", ()))
 
     def __str__(self) -> str:
-        return "".join(
-            (
-                f"<{type(self).__name__}",
-                f" nodes={self._nodes}",
-                f" relationships={self._relationships}" ">",
-            )
-        )
+        return f"<{type(self).__name__} nodes={self._nodes} relationships={self._relationships}>"
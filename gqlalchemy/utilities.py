@@ -65,14 +65,14 @@ class NetworkXCypherConfig:
 
 
 def _format_timedelta(duration: timedelta) -> str:
-    days = int(duration.total_seconds() // 86400)
-    remainder_sec = duration.total_seconds() - days * 86400
-    hours = int(remainder_sec // 3600)
-    remainder_sec -= hours * 3600
-    minutes = int(remainder_sec // 60)
-    remainder_sec -= minutes * 60
-
-    return f"P{days}DT{hours}H{minutes}M{remainder_sec}S"
+    total_microseconds = (duration.days * 86400 + duration.seconds) * 1_000_000 + duration.microseconds
+    days, remainder = divmod(total_microseconds, 86_400_000_000)
+    hours, remainder = divmod(remainder, 3_600_000_000)
+    minutes, remainder = divmod(remainder, 60_000_000)
+    seconds, microseconds = divmod(remainder, 1_000_000)
+    fraction = f"{microseconds:06d}".rstrip("0") or "0"
+
+    return f"P{days}DT{hours}H{minutes}M{seconds}.{fraction}S"
 
 
 def _is_torch_tensor(value):
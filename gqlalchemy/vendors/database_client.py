@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from typing import Any, Dict, Iterator, List, Optional
 
 from gqlalchemy.connection import Connection
@@ -52,13 +53,13 @@ class DatabaseClient(ABC):
         return self._port
 
     def execute_and_fetch(
-        self, query: str, parameters: Dict[str, Any] = {}, connection: Connection = None
+        self, query: str, parameters: Optional[Dict[str, Any]] = None, connection: Connection = None
     ) -> Iterator[Dict[str, Any]]:
         """Executes Cypher query and returns iterator of results."""
         connection = connection or self._get_cached_connection()
         return connection.execute_and_fetch(query, parameters)
 
-    def execute(self, query: str, parameters: Dict[str, Any] = {}, connection: Connection = None) -> None:
+    def execute(self, query: str, parameters: Optional[Dict[str, Any]] = None, connection: Connection = None) -> None:
         """Executes Cypher query without returning any results."""
         connection = connection or self._get_cached_connection()
         connection.execute(query, parameters)
@@ -152,6 +153,23 @@ class DatabaseClient(ABC):
             f"MATCH (node: {node._label})" f" WHERE {node._get_cypher_unique_fields_or_block('node')}" f" RETURN node;"
         )
 
+    def _update_node_with_unique_fields(self, node: Node) -> List[Node]:
+        """Returns all nodes from the database that have any of the unique
+        fields set to the values in the `node` object. If exactly one node
+        matches, its properties are updated with the values in `node` in the
+        same query.
+        """
+        results = self.execute_and_fetch(
+            f"OPTIONAL MATCH (node:{node._label}) WHERE{node._get_cypher_unique_fields_or_block('node')}"
+            "WITH collect(node) AS matching_nodes"
+            " FOREACH (matching_node IN CASE WHEN size(matching_nodes) = 1 THEN matching_nodes ELSE [] END"
+            f" | SET matching_node += {node._get_cypher_set_map()})"
+            " WITH matching_nodes"
+            " UNWIND matching_nodes AS node"
+            " RETURN node;"
+        )
+        return [result["node"] for result in results]
+
     def get_variable_assume_one(self, query_result: Iterator[Dict[str, Any]], variable_name: str) -> Any:
         """Returns a single result from the query_result (usually gotten from
         the execute_and_fetch function).
@@ -189,10 +207,50 @@ class DatabaseClient(ABC):
         """
         pass
 
-    def save_nodes(self, nodes: List[Node]) -> None:
-        """Saves a list of nodes to the database."""
-        for i in range(len(nodes)):
-            nodes[i]._id = self.save_node(nodes[i])._id
+    def save_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Saves a list of nodes to the database and returns the saved nodes.
+        Nodes that have an internal id or no unique fields are written with one
+        query per label combination. Nodes that have to be matched by their
+        unique fields are saved one by one with `save_node`.
+        """
+        results: List[Optional[Node]] = [None] * len(nodes)
+        batches = defaultdict(list)
+        for index, node in enumerate(nodes):
+            if node._id is None and node.has_unique_fields():
+                results[index] = self.save_node(node)
+            else:
+                batches[(node._label, node._id is None)].append(index)
+
+        for (_, create), indices in batches.items():
+            batch = [nodes[index] for index in indices]
+            saved = self.create_nodes(batch) if create else self.save_nodes_with_id(batch)
+            for index, node, result in zip(indices, batch, saved):
+                results[index] = self._save_node_properties_on_disk(node, result)
+
+        for node, result in zip(nodes, results):
+            node._id = result._id
+
+        return results
+
+    def create_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Creates nodes that share the same labels in the database with a
+        single query.
+        """
+        rows = [{"properties": node._get_cypher_set_map()} for node in nodes]
+        return self._fetch_batch(
+            rows, f"CREATE (node:{nodes[0]._label}) SET node += row.properties RETURN row.index AS index, node;"
+        )
+
+    def save_nodes_with_id(self, nodes: List[Node]) -> List[Node]:
+        """Saves nodes that share the same labels to the database using their
+        internal ids with a single query.
+        """
+        rows = [{"id": node._id, "properties": node._get_cypher_set_map()} for node in nodes]
+        return self._fetch_batch(
+            rows,
+            f"MATCH (node:{nodes[0]._label}) WHERE id(node) = row.id"
+            " SET node += row.properties RETURN row.index AS index, node;",
+        )
 
     def save_node_with_id(self, node: Node) -> Optional[Node]:
         """Saves a node to the database using the internal id."""
@@ -218,6 +276,62 @@ class DatabaseClient(ABC):
         """
         pass
 
+    def load_nodes(self, nodes: List[Node]) -> List[Node]:
+        """Loads a list of nodes from the database.
+        Nodes that have an internal id are fetched with one query per label
+        combination, the rest are loaded one by one with `load_node`.
+        If any of the nodes is not found it raises a GQLAlchemyError.
+        """
+        results: List[Optional[Node]] = [None] * len(nodes)
+        batches = defaultdict(list)
+        for index, node in enumerate(nodes):
+            if node._id is None:
+                results[index] = self.load_node(node)
+            else:
+                batches[node._label].append(index)
+
+        for label, indices in batches.items():
+            rows = [{"id": nodes[index]._id} for index in indices]
+            loaded = self._fetch_batch(
+                rows, f"MATCH (node:{label}) WHERE id(node) = row.id RETURN row.index AS index, node;"
+            )
+            for index, result in zip(indices, loaded):
+                results[index] = self._load_node_properties_on_disk(result)
+
+        return results
+
+    def _fetch_batch(self, rows: List[Dict[str, Any]], query: str, variable_name: str = "node") -> List[Any]:
+        """Unwinds `rows` as `row`, runs `query` for each of them and returns
+        `variable_name` for every row, ordered by the row `index`. Row values
+        are written as cypher literals, so strings in them must already be
+        escaped cypher expressions.
+        If a row yields no result it raises a GQLAlchemyError.
+        """
+        batch = ", ".join(
+            "{" + ", ".join([f"index: {index}", *(f"{key}: {value}" for key, value in row.items())]) + "}"
+            for index, row in enumerate(rows)
+        )
+        results = [None] * len(rows)
+        for result in self.execute_and_fetch(f"UNWIND [{batch}] AS row {query}"):
+            results[result["index"]] = result[variable_name]
+
+        if any(result is None for result in results):
+            raise GQLAlchemyError("No result found for some of the rows in the batch.")
+
+        return results
+
+    def _save_node_properties_on_disk(self, node: Node, result: Node) -> Node:
+        """Saves the on_disk properties of the node if the database supports
+        on disk property storage.
+        """
+        return result
+
+    def _load_node_properties_on_disk(self, result: Node) -> Node:
+        """Loads the on_disk properties of the node if the database supports
+        on disk property storage.
+        """
+        return result
+
     def load_node_with_all_properties(self, node: Node) -> Optional[Node]:
         """Loads a node from the database with all equal property values."""
         results = self.execute_and_fetch(
@@ -283,10 +397,79 @@ class DatabaseClient(ABC):
         """
         pass
 
-    def save_relationships(self, relationships: List[Relationship]) -> None:
-        """Saves a list of relationships to the database."""
-        for i in range(len(relationships)):
-            relationships[i]._id = self.save_relationship(relationships[i])._id
+    def save_relationships(self, relationships: List[Relationship]) -> List[Relationship]:
+        """Saves a list of relationships to the database.
+        Relationships with a start and end node id are written with one query
+        per relationship type, the rest are saved one by one with
+        `save_relationship`.
+        """
+        results: List[Optional[Relationship]] = [None] * len(relationships)
+        batches = defaultdict(list)
+        for index, relationship in enumerate(relationships):
+            if relationship._start_node_id is None or relationship._end_node_id is None:
+                results[index] = self.save_relationship(relationship)
+            else:
+                batches[(relationship._type, relationship._id is None)].append(index)
+
+        for (_, create), indices in batches.items():
+            batch = [relationships[index] for index in indices]
+            saved = self.create_relationships(batch) if create else self.save_relationships_with_id(batch)
+            for index, relationship, result in zip(indices, batch, saved):
+                results[index] = self._save_relationship_properties_on_disk(relationship, result)
+
+        for relationship, result in zip(relationships, results):
+            relationship._id = result._id
+
+        return results
+
+    def create_relationships(self, relationships: List[Relationship]) -> List[Relationship]:
+        """Creates relationships that share the same type in the database with
+        a single query.
+        """
+        rows = [
+            {
+                "start_node_id": relationship._start_node_id,
+                "end_node_id": relationship._end_node_id,
+                "properties": relationship._get_cypher_set_map(),
+            }
+            for relationship in relationships
+        ]
+        return self._fetch_batch(
+            rows,
+            "MATCH (start_node), (end_node)"
+            " WHERE id(start_node) = row.start_node_id AND id(end_node) = row.end_node_id"
+            f" CREATE (start_node)-[relationship:{relationships[0]._type}]->(end_node)"
+            " SET relationship += row.properties RETURN row.index AS index, relationship;",
+            "relationship",
+        )
+
+    def save_relationships_with_id(self, relationships: List[Relationship]) -> List[Relationship]:
+        """Saves relationships that share the same type to the database using
+        their internal ids with a single query.
+        """
+        rows = [
+            {
+                "id": relationship._id,
+                "start_node_id": relationship._start_node_id,
+                "end_node_id": relationship._end_node_id,
+                "properties": relationship._get_cypher_set_map(),
+            }
+            for relationship in relationships
+        ]
+        return self._fetch_batch(
+            rows,
+            f"MATCH (start_node)-[relationship:{relationships[0]._type}]->(end_node)"
+            " WHERE id(start_node) = row.start_node_id AND id(end_node) = row.end_node_id"
+            " AND id(relationship) = row.id"
+            " SET relationship += row.properties RETURN row.index AS index, relationship;",
+            "relationship",
+        )
+
+    def _save_relationship_properties_on_disk(self, relationship: Relationship, result: Relationship) -> Relationship:
+        """Saves the on_disk properties of the relationship if the database
+        supports on disk property storage.
+        """
+        return result
 
     def save_relationship_with_id(self, relationship: Relationship) -> Optional[Relationship]:
         """Saves a relationship to the database using the relationship._id."""
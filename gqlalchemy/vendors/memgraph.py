@@ -12,10 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from dataclasses import dataclass, field as dataclass_field
 from enum import Enum
+from operator import itemgetter
 import os
 import sqlite3
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from gqlalchemy.connection import Connection, MemgraphConnection
 from gqlalchemy.disk_storage import OnDiskPropertyDatabase
@@ -33,6 +35,7 @@ from gqlalchemy.models import (
     MemgraphTrigger,
     Node,
     Relationship,
+    _escape_quotes,
 )
 from gqlalchemy.vendors.database_client import DatabaseClient
 from gqlalchemy.graph_algorithms.query_modules import QueryModule
@@ -41,24 +44,18 @@ import gqlalchemy.memgraph_constants as mg_consts
 __all__ = ("Memgraph",)
 
 
+@dataclass(frozen=True, eq=True)
 class MemgraphTransaction:
-    def __init__(self, username: str, transaction_id: str, query: list, metadata: dict):
-        self.username = (username,)
-        self.transaction_id = transaction_id
-        self.query = query
-        self.metadata = metadata
-
-    def __repr__(self):
-        return f"MemgraphTransaction(username={self.username}, transaction_id={self.transaction_id}, query={self.query}, metadata={self.metadata})"
+    username: str
+    transaction_id: str
+    query: list = dataclass_field(hash=False)
+    metadata: dict = dataclass_field(hash=False)
 
 
+@dataclass(frozen=True, eq=True)
 class MemgraphTerminatedTransaction:
-    def __init__(self, transaction_id: str, killed: bool):
-        self.transaction_id = transaction_id
-        self.killed = killed
-
-    def __repr__(self):
-        return f"MemgraphTerminatedTransaction(transaction_id={self.transaction_id}, killed={self.killed})"
+    transaction_id: str
+    killed: bool
 
 
 class MemgraphConstants:
@@ -79,6 +76,10 @@ class MemgraphStorageMode(Enum):
         return self.value
 
 
+_transaction_fields = itemgetter("username", "transaction_id", "query", "metadata")
+_terminated_transaction_fields = itemgetter("transaction_id", "killed")
+
+
 def create_transaction(transaction_data) -> MemgraphTransaction:
     """Create a MemgraphTransaction object from transaction data.
     Args:
@@ -86,12 +87,7 @@ def create_transaction(transaction_data) -> MemgraphTransaction:
     Returns:
         MemgraphTransaction: A MemgraphTransaction object.
     """
-    return MemgraphTransaction(
-        username=transaction_data["username"],
-        transaction_id=transaction_data["transaction_id"],
-        query=transaction_data["query"],
-        metadata=transaction_data["metadata"],
-    )
+    return MemgraphTransaction(*_transaction_fields(transaction_data))
 
 
 def create_terminated_transaction(transaction_data) -> MemgraphTerminatedTransaction:
@@ -101,10 +97,7 @@ def create_terminated_transaction(transaction_data) -> MemgraphTerminatedTransac
     Returns:
         MemgraphTerminatedTransaction: A MemgraphTerminatedTransaction object.
     """
-    return MemgraphTerminatedTransaction(
-        transaction_id=transaction_data["transaction_id"],
-        killed=transaction_data["killed"],
-    )
+    return MemgraphTerminatedTransaction(*_terminated_transaction_fields(transaction_data))
 
 
 class Memgraph(DatabaseClient):
@@ -117,68 +110,77 @@ class Memgraph(DatabaseClient):
         encrypted: bool = mg_consts.MG_ENCRYPTED,
         client_name: str = mg_consts.MG_CLIENT_NAME,
         lazy: bool = mg_consts.MG_LAZY,
+        fetch_size: int = mg_consts.MG_FETCH_SIZE,
     ):
         super().__init__(
             host=host, port=port, username=username, password=password, encrypted=encrypted, client_name=client_name
         )
         self._lazy = lazy
-        self._on_disk_db = None
+        self._fetch_size = fetch_size
+        self.on_disk_db: Optional[OnDiskPropertyDatabase] = None
+        self.query_modules: Optional[List[QueryModule]] = None
 
     def get_indexes(self) -> List[MemgraphIndex]:
         """Returns a list of all database indexes (label and label-property types)."""
-        indexes = []
-        for result in self.execute_and_fetch("SHOW INDEX INFO;"):
-            indexes.append(
-                MemgraphIndex(
-                    result[MemgraphConstants.LABEL],
-                    result[MemgraphConstants.PROPERTY],
-                )
-            )
-        return indexes
+        label_key, property_key = MemgraphConstants.LABEL, MemgraphConstants.PROPERTY
+        return [
+            MemgraphIndex(result[label_key], result[property_key])
+            for result in self.execute_and_fetch("SHOW INDEX INFO;")
+        ]
 
     def ensure_indexes(self, indexes: List[MemgraphIndex]) -> None:
         """Ensures that database indexes match input indexes."""
-        old_indexes = set(self.get_indexes())
-        new_indexes = set(indexes)
-        for obsolete_index in old_indexes.difference(new_indexes):
-            self.drop_index(obsolete_index)
-        for missing_index in new_indexes.difference(old_indexes):
-            self.create_index(missing_index)
+        old_indexes = {(index.label, index.property): index for index in self.get_indexes()}
+        new_indexes = {(index.label, index.property): index for index in indexes}
+        for key, obsolete_index in old_indexes.items():
+            if key not in new_indexes:
+                self.drop_index(obsolete_index)
+        for key, missing_index in new_indexes.items():
+            if key not in old_indexes:
+                self.create_index(missing_index)
 
     def get_constraints(
         self,
     ) -> List[Union[MemgraphConstraintExists, MemgraphConstraintUnique]]:
         """Returns a list of all database constraints (label and label-property types)."""
-        constraints: List[Union[MemgraphConstraintExists, MemgraphConstraintUnique]] = []
-        for result in self.execute_and_fetch("SHOW CONSTRAINT INFO;"):
-            if result[MemgraphConstants.CONSTRAINT_TYPE] == MemgraphConstants.UNIQUE:
-                constraints.append(
-                    MemgraphConstraintUnique(
-                        result[MemgraphConstants.LABEL],
-                        tuple(result[MemgraphConstants.PROPERTIES]),
-                    )
-                )
-            elif result[MemgraphConstants.CONSTRAINT_TYPE] == MemgraphConstants.EXISTS:
-                constraints.append(
-                    MemgraphConstraintExists(
-                        result[MemgraphConstants.LABEL],
-                        result[MemgraphConstants.PROPERTIES],
-                    )
-                )
-        return constraints
+        unique_constraints, exists_constraints = self._fetch_constraints()
+        return unique_constraints + exists_constraints
 
     def get_exists_constraints(
         self,
     ) -> List[MemgraphConstraintExists]:
-        return [x for x in self.get_constraints() if isinstance(x, MemgraphConstraintExists)]
+        return self._fetch_constraints()[1]
 
     def get_unique_constraints(
         self,
     ) -> List[MemgraphConstraintUnique]:
-        return [x for x in self.get_constraints() if isinstance(x, MemgraphConstraintUnique)]
+        return self._fetch_constraints()[0]
+
+    def _fetch_constraints(self) -> Tuple[List[MemgraphConstraintUnique], List[MemgraphConstraintExists]]:
+        """Returns the unique and the exists constraints of the database, read
+        in a single pass over SHOW CONSTRAINT INFO.
+        """
+        unique_constraints: List[MemgraphConstraintUnique] = []
+        exists_constraints: List[MemgraphConstraintExists] = []
+        constraint_type_key, label_key, properties_key = (
+            MemgraphConstants.CONSTRAINT_TYPE,
+            MemgraphConstants.LABEL,
+            MemgraphConstants.PROPERTIES,
+        )
+        unique, exists = MemgraphConstants.UNIQUE, MemgraphConstants.EXISTS
+        for result in self.execute_and_fetch("SHOW CONSTRAINT INFO;"):
+            constraint_type = result[constraint_type_key]
+            if constraint_type == unique:
+                unique_constraints.append(MemgraphConstraintUnique(result[label_key], tuple(result[properties_key])))
+            elif constraint_type == exists:
+                exists_constraints.append(MemgraphConstraintExists(result[label_key], result[properties_key]))
+
+        return unique_constraints, exists_constraints
 
     def new_connection(self) -> Connection:
-        """Creates new Memgraph connection."""
+        """Creates new Memgraph connection, reusing an idle pooled connection
+        to the same server when there is one.
+        """
         args = dict(
             host=self._host,
             port=self._port,
@@ -186,6 +188,8 @@ class Memgraph(DatabaseClient):
             password=self._password,
             encrypted=self._encrypted,
             client_name=self._client_name,
+            lazy=self._lazy,
+            fetch_size=self._fetch_size,
         )
         return MemgraphConnection(**args)
 
@@ -218,27 +222,30 @@ class Memgraph(DatabaseClient):
 
     def get_triggers(self) -> List[MemgraphTrigger]:
         """Returns a list of all database triggers."""
-        triggers_list = list(self.execute_and_fetch("SHOW TRIGGERS;"))
-        memgraph_triggers_list = []
-        for trigger in triggers_list:
-            event_type = trigger["event type"]
-            event_object = None
-
-            if event_type == "ANY":
-                event_type = None
-            elif len(event_type.split()) > 1:
-                [event_object, event_type] = [part for part in event_type.split()]
-
-            memgraph_triggers_list.append(
-                MemgraphTrigger(
-                    name=trigger["trigger name"],
-                    event_type=event_type,
-                    event_object=event_object,
-                    execution_phase=trigger["phase"].split()[0],
-                    statement=trigger["statement"],
-                )
-            )
-        return memgraph_triggers_list
+        return [self._parse_trigger(trigger) for trigger in self.execute_and_fetch("SHOW TRIGGERS;")]
+
+    @staticmethod
+    def _parse_trigger(trigger_data: Dict[str, Any]) -> MemgraphTrigger:
+        """Creates a MemgraphTrigger from a row of SHOW TRIGGERS."""
+        event_type = trigger_data["event type"]
+        event_object = None
+
+        if event_type == "ANY":
+            event_type = None
+        else:
+            head, separator, tail = event_type.partition(" ")
+            if separator:
+                event_object, event_type = head, tail
+
+        execution_phase, _, _ = trigger_data["phase"].partition(" ")
+
+        return MemgraphTrigger(
+            name=trigger_data["trigger name"],
+            event_type=event_type,
+            event_object=event_object,
+            execution_phase=execution_phase,
+            statement=trigger_data["statement"],
+        )
 
     def drop_trigger(self, trigger: MemgraphTrigger) -> None:
         """Drop a trigger."""
@@ -247,20 +254,12 @@ class Memgraph(DatabaseClient):
 
     def drop_triggers(self) -> None:
         """Drops all triggers in the database."""
-        for trigger in self.get_triggers():
-            self.drop_trigger(trigger)
-
-    def _new_connection(self) -> Connection:
-        """Creates new Memgraph connection."""
-        args = dict(
-            host=self._host,
-            port=self._port,
-            username=self._username,
-            password=self._password,
-            encrypted=self._encrypted,
-            client_name=self._client_name,
-        )
-        return MemgraphConnection(**args)
+        connection = self._get_cached_connection()
+        trigger_names = [
+            trigger["trigger name"] for trigger in self.execute_and_fetch("SHOW TRIGGERS;", connection=connection)
+        ]
+        for trigger_name in trigger_names:
+            self.execute(f"DROP TRIGGER {trigger_name};", connection=connection)
 
     def init_disk_storage(self, on_disk_db: OnDiskPropertyDatabase) -> None:
         """Adds and OnDiskPropertyDatabase to the database so that any property
@@ -286,14 +285,14 @@ class Memgraph(DatabaseClient):
         if node._id is not None:
             result = self.save_node_with_id(node)
         elif node.has_unique_fields():
-            matching_nodes = list(self._get_nodes_with_unique_fields(node))
+            matching_nodes = self._update_node_with_unique_fields(node)
             if len(matching_nodes) > 1:
                 raise GQLAlchemyUniquenessConstraintError(
                     f"Uniqueness constraints match multiple nodes: {matching_nodes}"
                 )
             elif len(matching_nodes) == 1:
-                node._id = matching_nodes[0]["node"]._id
-                result = self.save_node_with_id(node)
+                result = matching_nodes[0]
+                node._id = result._id
             else:
                 result = self.create_node(node)
         else:
@@ -306,12 +305,21 @@ class Memgraph(DatabaseClient):
         """Saves all on_disk properties to the on disk database attached to
         the database.
         """
-        for field in node.__fields__:
+        on_disk_fields = type(node)._on_disk_fields
+        if not on_disk_fields:
+            return result
+
+        properties = {}
+        for field in on_disk_fields:
             value = getattr(node, field, None)
-            if value is not None and "on_disk" in node.__fields__[field].field_info.extra:
-                if self.on_disk_db is None:
-                    raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
-                self.on_disk_db.save_node_property(result._id, field, value)
+            if value is not None:
+                properties[field] = value
+
+        if properties:
+            if self.on_disk_db is None:
+                raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
+            self.on_disk_db.save_node_properties(result._id, properties)
+            for field, value in properties.items():
                 setattr(result, field, value)
 
         return result
@@ -341,16 +349,19 @@ class Memgraph(DatabaseClient):
 
     def _load_node_properties_on_disk(self, result: Node) -> Node:
         """Loads all on_disk properties from the on disk database."""
-        for field in result.__fields__:
+        on_disk_fields = type(result)._on_disk_fields
+        if not on_disk_fields:
+            return result
+        if self.on_disk_db is None:
+            raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
+
+        for field in on_disk_fields:
             value = getattr(result, field, None)
-            if "on_disk" in result.__fields__[field].field_info.extra:
-                if self.on_disk_db is None:
-                    raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
-                try:
-                    new_value = self.on_disk_db.load_node_property(result._id, field)
-                except sqlite3.OperationalError:
-                    new_value = value
-                setattr(result, field, new_value)
+            try:
+                new_value = self.on_disk_db.load_node_property(result._id, field)
+            except sqlite3.OperationalError:
+                new_value = value
+            setattr(result, field, new_value)
 
         return result
 
@@ -380,16 +391,19 @@ class Memgraph(DatabaseClient):
         Memgraph().init_disk_storage() throws a
         GQLAlchemyOnDiskPropertyDatabaseNotDefinedError.
         """
-        for field in result.__fields__:
+        on_disk_fields = type(result)._on_disk_fields
+        if not on_disk_fields:
+            return result
+        if self.on_disk_db is None:
+            raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
+
+        for field in on_disk_fields:
             value = getattr(result, field, None)
-            if "on_disk" in result.__fields__[field].field_info.extra:
-                if self.on_disk_db is None:
-                    raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
-                try:
-                    new_value = self.on_disk_db.load_relationship_property(result._id, field)
-                except sqlite3.OperationalError:
-                    new_value = value
-                setattr(result, field, new_value)
+            try:
+                new_value = self.on_disk_db.load_relationship_property(result._id, field)
+            except sqlite3.OperationalError:
+                new_value = value
+            setattr(result, field, new_value)
 
         return result
 
@@ -416,12 +430,21 @@ class Memgraph(DatabaseClient):
         added with Memgraph().init_disk_storage(db). If OnDiskPropertyDatabase
         is not defined raises GQLAlchemyOnDiskPropertyDatabaseNotDefinedError.
         """
-        for field in relationship.__fields__:
+        on_disk_fields = type(relationship)._on_disk_fields
+        if not on_disk_fields:
+            return result
+
+        properties = {}
+        for field in on_disk_fields:
             value = getattr(relationship, field, None)
-            if value is not None and "on_disk" in relationship.__fields__[field].field_info.extra:
-                if self.on_disk_db is None:
-                    raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
-                self.on_disk_db.save_relationship_property(result._id, field, value)
+            if value is not None:
+                properties[field] = value
+
+        if properties:
+            if self.on_disk_db is None:
+                raise GQLAlchemyOnDiskPropertyDatabaseNotDefinedError()
+            self.on_disk_db.save_relationship_properties(result._id, properties)
+            for field, value in properties.items():
                 setattr(result, field, value)
 
         return result
@@ -438,7 +461,7 @@ class Memgraph(DatabaseClient):
             update: Whether to update the list of modules in
             self.query_modules. (Optional)
         """
-        if not hasattr(self, "query_modules") or update:
+        if self.query_modules is None or update:
             results = self.execute_and_fetch("CALL mg.procedures() YIELD *;")
             self.query_modules = [QueryModule(**module_dict) for module_dict in results]
 
@@ -465,9 +488,15 @@ class Memgraph(DatabaseClient):
         if not os.path.isfile(file_path):
             raise GQLAlchemyFileNotFoundError(path=file_path)
 
-        file_text = open(file_path, "r").read().replace("'", '"')
-        query = f"CALL mg.create_module_file('{module_name}','{file_text}') YIELD *;"
-        list(self.execute_and_fetch(query))
+        with open(file_path, "r") as module_file:
+            file_text = module_file.read()
+        list(
+            self.execute_and_fetch(
+                "CALL mg.create_module_file($module_name, $file_text) YIELD *;",
+                {"module_name": module_name, "file_text": file_text},
+            )
+        )
+        self.query_modules = None
 
         return self
 
@@ -493,8 +522,13 @@ class Memgraph(DatabaseClient):
 
     def get_storage_mode(self) -> str:
         """Returns the storage mode of the Memgraph instance."""
-        result = self.execute_and_fetch("SHOW STORAGE INFO;")
-        storage_mode_value = next((item["value"] for item in result if item["storage info"] == "storage_mode"), None)
+        for item in self.execute_and_fetch("SHOW STORAGE INFO;"):
+            if item["storage info"] == "storage_mode":
+                storage_mode_value = item["value"]
+                break
+        else:
+            storage_mode_value = None
+
         return MemgraphStorageMode(storage_mode_value).value
 
     def set_storage_mode(self, storage_mode: MemgraphStorageMode) -> None:
@@ -507,10 +541,7 @@ class Memgraph(DatabaseClient):
             List[MemgraphTransaction]: A list of MemgraphTransaction objects.
         """
 
-        transactions_data = self.execute_and_fetch("SHOW TRANSACTIONS;")
-        transactions = list(map(create_transaction, transactions_data))
-
-        return transactions
+        return list(map(create_transaction, self.execute_and_fetch("SHOW TRANSACTIONS;")))
 
     def terminate_transactions(self, transaction_ids: List[str]) -> List[MemgraphTerminatedTransaction]:
         """Terminate transactions in the database.
@@ -521,11 +552,9 @@ class Memgraph(DatabaseClient):
         """
 
         query = (
-            "TERMINATE TRANSACTIONS " + ", ".join([f"'{transaction_id}'" for transaction_id in transaction_ids]) + ";"
+            "TERMINATE TRANSACTIONS "
+            + ", ".join(f"'{_escape_quotes(transaction_id)}'" for transaction_id in transaction_ids)
+            + ";"
         )
 
-        transactions_data = self.execute_and_fetch(query)
-
-        terminated_transactions = list(map(create_terminated_transaction, transactions_data))
-
-        return terminated_transactions
+        return list(map(create_terminated_transaction, self.execute_and_fetch(query)))
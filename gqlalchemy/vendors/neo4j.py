@@ -37,6 +37,7 @@ NEO4J_USERNAME = os.getenv("NEO4J_USERNAME", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "test")
 NEO4J_ENCRYPTED = os.getenv("NEO4J_ENCRYPT", "false").lower() == "true"
 NEO4J_CLIENT_NAME = os.getenv("NEO4J_CLIENT_NAME", "neo4j")
+NEO4J_FETCH_SIZE = int(os.getenv("NEO4J_FETCH_SIZE", "1000"))
 
 
 class Neo4jConstants:
@@ -61,10 +62,12 @@ class Neo4j(DatabaseClient):
         password: str = NEO4J_PASSWORD,
         encrypted: bool = NEO4J_ENCRYPTED,
         client_name: str = NEO4J_CLIENT_NAME,
+        fetch_size: int = NEO4J_FETCH_SIZE,
     ):
         super().__init__(
             host=host, port=port, username=username, password=password, encrypted=encrypted, client_name=client_name
         )
+        self._fetch_size = fetch_size
         self._cached_connection: Optional[Connection] = None
 
     def get_indexes(self) -> List[Neo4jIndex]:
@@ -129,6 +132,7 @@ class Neo4j(DatabaseClient):
             password=self._password,
             encrypted=self._encrypted,
             client_name=self._client_name,
+            fetch_size=self._fetch_size,
         )
         return Neo4jConnection(**args)
 
@@ -145,14 +149,14 @@ class Neo4j(DatabaseClient):
         if node._id is not None:
             result = self.save_node_with_id(node)
         elif node.has_unique_fields():
-            matching_nodes = list(self._get_nodes_with_unique_fields(node))
+            matching_nodes = self._update_node_with_unique_fields(node)
             if len(matching_nodes) > 1:
                 raise GQLAlchemyUniquenessConstraintError(
                     f"Uniqueness constraints match multiple nodes: {matching_nodes}"
                 )
             elif len(matching_nodes) == 1:
-                node._id = matching_nodes[0]["node"]._id
-                result = self.save_node_with_id(node)
+                result = matching_nodes[0]
+                node._id = result._id
             else:
                 result = self.create_node(node)
         else:
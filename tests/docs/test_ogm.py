@@ -12,65 +12,79 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from types import SimpleNamespace
 from typing import Optional
 
+import pytest
+
 from gqlalchemy import Memgraph, Node, Relationship, Field, match
 from gqlalchemy.query_builders.memgraph_query_builder import Operator
 
 db = Memgraph()
 
 
-class UserSave(Node):
-    id: str = Field(index=True, exist=True, unique=True, db=db)
-    username: str = Field(index=True, exist=True, unique=True, db=db)
-
-
-class UserMap(Node):
-    id: str = Field(index=True, exist=True, unique=True, db=db)
-
-
-class Streamer(UserMap):
-    id: str = Field(index=True, exist=True, unique=True, db=db)
-    username: Optional[str] = Field(index=True, exist=True, unique=True, db=db)
-    url: Optional[str] = Field()
-    followers: Optional[int] = Field()
-    createdAt: Optional[str] = Field()
-    totalViewCount: Optional[int] = Field()
-    description: Optional[str] = Field()
+@pytest.fixture(scope="module")
+def models():
+    """Defines the models of the module. Indexes and constraints of the models
+    are created when the classes are defined, so this is deferred until the
+    first test runs instead of happening at import time.
+    """
 
+    class UserSave(Node):
+        id: str = Field(index=True, exist=True, unique=True, db=db)
+        username: str = Field(index=True, exist=True, unique=True, db=db)
 
-class StreamerLoad(Node):
-    id: str = Field(index=True, unique=True, db=db)
-    name: Optional[str] = Field(index=True, exists=True, unique=True, db=db)
+    class UserMap(Node):
+        id: str = Field(index=True, exist=True, unique=True, db=db)
 
+    class Streamer(UserMap):
+        id: str = Field(index=True, exist=True, unique=True, db=db)
+        username: Optional[str] = Field(index=True, exist=True, unique=True, db=db)
+        url: Optional[str] = Field()
+        followers: Optional[int] = Field()
+        createdAt: Optional[str] = Field()
+        totalViewCount: Optional[int] = Field()
+        description: Optional[str] = Field()
 
-class Team(Node):
-    name: str = Field(unique=True, db=db)
+    class StreamerLoad(Node):
+        id: str = Field(index=True, unique=True, db=db)
+        name: Optional[str] = Field(index=True, exists=True, unique=True, db=db)
 
+    class Team(Node):
+        name: str = Field(unique=True, db=db)
 
-class IsPartOf(Relationship, type="IS_PART_OF"):
-    date: Optional[str] = Field()
+    class IsPartOf(Relationship, type="IS_PART_OF"):
+        date: Optional[str] = Field()
 
+    class Language(Node):
+        name: str = Field(unique=True, db=db)
 
-class Language(Node):
-    name: str = Field(unique=True, db=db)
+    class ChatsWith(Relationship, type="CHATS_WITH"):
+        lastChatted: Optional[str] = Field()
 
+    class Speaks(Relationship, type="SPEAKS"):
+        pass
 
-class ChatsWith(Relationship, type="CHATS_WITH"):
-    lastChatted: Optional[str] = Field()
+    class SpeaksTemp(Relationship, type="SPEAKSTEMP"):
+        pass
 
-
-class Speaks(Relationship, type="SPEAKS"):
-    pass
-
-
-class SpeaksTemp(Relationship, type="SPEAKSTEMP"):
-    pass
+    return SimpleNamespace(
+        UserSave=UserSave,
+        UserMap=UserMap,
+        Streamer=Streamer,
+        StreamerLoad=StreamerLoad,
+        Team=Team,
+        IsPartOf=IsPartOf,
+        Language=Language,
+        ChatsWith=ChatsWith,
+        Speaks=Speaks,
+        SpeaksTemp=SpeaksTemp,
+    )
 
 
 class TestMapNodesAndRelationships:
-    def test_node_mapping(self):
-        streamer = Streamer(
+    def test_node_mapping(self, models):
+        streamer = models.Streamer(
             id="7",
             username="Ivan",
             url="myurl.com",
@@ -96,8 +110,8 @@ class TestMapNodesAndRelationships:
         assert result.totalViewCount == streamer.totalViewCount
         assert result.description == streamer.description
 
-    def test_relationship_mapping(self):
-        streamer_1 = Streamer(
+    def test_relationship_mapping(self, models):
+        streamer_1 = models.Streamer(
             id="8",
             username="Kate",
             url="myurl.com",
@@ -106,7 +120,7 @@ class TestMapNodesAndRelationships:
             totalViewCount=6666,
             description="Hi, I am streamer!",
         ).save(db)
-        streamer_2 = Streamer(
+        streamer_2 = models.Streamer(
             id="9",
             username="Mislav",
             url="myurl.com",
@@ -115,7 +129,7 @@ class TestMapNodesAndRelationships:
             totalViewCount=6666,
             description="Hi, I am streamer!",
         ).save(db)
-        chats_with = ChatsWith(
+        chats_with = models.ChatsWith(
             _start_node_id=streamer_1._id, _end_node_id=streamer_2._id, lastChatted="2021-04-25"
         ).save(db)
 
@@ -128,9 +142,9 @@ class TestMapNodesAndRelationships:
 
 
 class TestSaveNodesAndRelationships:
-    def test_node_saving_1(self):
-        user = UserSave(id="3", username="John").save(db)
-        language = Language(name="en").save(db)
+    def test_node_saving_1(self, models):
+        user = models.UserSave(id="3", username="John").save(db)
+        language = models.Language(name="en").save(db)
 
         result = next(
             match()
@@ -147,9 +161,9 @@ class TestSaveNodesAndRelationships:
 
         assert result_2._labels == language._labels
 
-    def test_node_saving_2(self):
-        user = UserSave(id="4", username="James")
-        language = Language(name="hr")
+    def test_node_saving_2(self, models):
+        user = models.UserSave(id="4", username="James")
+        language = models.Language(name="hr")
 
         db.save_node(user)
         db.save_node(language)
@@ -169,11 +183,11 @@ class TestSaveNodesAndRelationships:
 
         assert result_2._labels == language._labels
 
-    def test_relationship_saving_1(self):
-        user = UserSave(id="55", username="Jimmy").save(db)
-        language = Language(name="ko").save(db)
+    def test_relationship_saving_1(self, models):
+        user = models.UserSave(id="55", username="Jimmy").save(db)
+        language = models.Language(name="ko").save(db)
 
-        speaks_rel = Speaks(_start_node_id=user._id, _end_node_id=language._id).save(db)
+        speaks_rel = models.Speaks(_start_node_id=user._id, _end_node_id=language._id).save(db)
 
         result = next(match().node().to("SPEAKS", variable="s").node().return_().execute())["s"]
 
@@ -181,11 +195,11 @@ class TestSaveNodesAndRelationships:
         assert result._end_node_id == language._id
         assert result._type == speaks_rel._type
 
-    def test_relationship_saving_2(self):
-        user = UserSave(id="35", username="Jessica").save(db)
-        language = Language(name="de").save(db)
+    def test_relationship_saving_2(self, models):
+        user = models.UserSave(id="35", username="Jessica").save(db)
+        language = models.Language(name="de").save(db)
 
-        speaks_rel = SpeaksTemp(_start_node_id=user._id, _end_node_id=language._id)
+        speaks_rel = models.SpeaksTemp(_start_node_id=user._id, _end_node_id=language._id)
         db.save_relationship(speaks_rel)
 
         result = next(match().node().to("SPEAKSTEMP", variable="s").node().return_().execute())["s"]
@@ -196,12 +210,12 @@ class TestSaveNodesAndRelationships:
 
 
 class TestLoadNodesAndRelationships:
-    def test_node_load(self):
-        streamer = StreamerLoad(name="Jack", id="54").save(db)
-        team = Team(name="Warriors").save(db)
+    def test_node_load(self, models):
+        streamer = models.StreamerLoad(name="Jack", id="54").save(db)
+        team = models.Team(name="Warriors").save(db)
 
-        loaded_streamer = StreamerLoad(id="54").load(db=db)
-        loaded_team = Team(name="Warriors").load(db=db)
+        loaded_streamer = models.StreamerLoad(id="54").load(db=db)
+        loaded_team = models.Team(name="Warriors").load(db=db)
 
         assert streamer.name == loaded_streamer.name
         assert streamer.id == loaded_streamer.id
@@ -211,9 +225,9 @@ class TestLoadNodesAndRelationships:
         assert team._labels == {"Team"}
         assert team._labels == loaded_team._labels
 
-        is_part_of = IsPartOf(_start_node_id=loaded_streamer._id, _end_node_id=loaded_team._id, date="2021-04-26").save(
-            db
-        )
+        is_part_of = models.IsPartOf(
+            _start_node_id=loaded_streamer._id, _end_node_id=loaded_team._id, date="2021-04-26"
+        ).save(db)
 
         result = next(match().node().to("IS_PART_OF", variable="i").node().return_().execute())["i"]
 
@@ -221,11 +235,11 @@ class TestLoadNodesAndRelationships:
         assert result._end_node_id == team._id
         assert result._type == is_part_of._type
 
-    def test_relationship_load(self):
-        streamer = StreamerLoad(name="Hayley", id="36").save(db)
-        team = Team(name="Lakers").save(db)
-        is_part_of = IsPartOf(_start_node_id=streamer._id, _end_node_id=team._id, date="2021-04-20").save(db)
-        loaded_is_part_of = IsPartOf(_start_node_id=streamer._id, _end_node_id=team._id).load(db)
+    def test_relationship_load(self, models):
+        streamer = models.StreamerLoad(name="Hayley", id="36").save(db)
+        team = models.Team(name="Lakers").save(db)
+        is_part_of = models.IsPartOf(_start_node_id=streamer._id, _end_node_id=team._id, date="2021-04-20").save(db)
+        loaded_is_part_of = models.IsPartOf(_start_node_id=streamer._id, _end_node_id=team._id).load(db)
 
         assert loaded_is_part_of._type == "IS_PART_OF"
         assert loaded_is_part_of._type == is_part_of._type
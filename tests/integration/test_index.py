@@ -37,6 +37,23 @@ def test_index_property(memgraph):
     assert set(actual_index) == {MemgraphIndex("Human", "id")}
 
 
+def test_get_indexes_sees_schema_changes(memgraph):
+    memgraph.create_index(MemgraphIndex("Animal"))
+    assert set(memgraph.get_indexes()) == {MemgraphIndex("Animal")}
+
+    memgraph.execute("CREATE INDEX ON :Human(id);")
+    list(memgraph.execute_and_fetch("CREATE INDEX ON :Plant;"))
+    assert set(memgraph.get_indexes()) == {
+        MemgraphIndex("Animal"),
+        MemgraphIndex("Human", "id"),
+        MemgraphIndex("Plant"),
+    }
+
+    other_client = type(memgraph)()
+    other_client.drop_index(MemgraphIndex("Animal"))
+    assert set(memgraph.get_indexes()) == {MemgraphIndex("Human", "id"), MemgraphIndex("Plant")}
+
+
 def test_missing_db_in_node_class(memgraph):
     with pytest.raises(GQLAlchemyDatabaseMissingInNodeClassError):
 
@@ -111,3 +111,14 @@ def test_pulsar_stream_extended_cypher():
     )
     query = "CREATE PULSAR STREAM test_stream TOPICS topic TRANSFORM pulsar_stream.transform BATCH_INTERVAL 9999 BATCH_SIZE 99 SERVICE_URL '127.0.0.1:6650';"
     assert pulsar_stream.to_cypher() == query
+
+
+def test_kafka_stream_bootstrap_servers_are_escaped():
+    kafka_stream = MemgraphKafkaStream(
+        name="test_stream",
+        topics=["topic"],
+        transform="kafka_stream.transform",
+        bootstrap_servers=["local'host:9092"],
+    )
+    query = "CREATE KAFKA STREAM test_stream TOPICS topic TRANSFORM kafka_stream.transform BOOTSTRAP_SERVERS 'local\\'host:9092';"
+    assert kafka_stream.to_cypher() == query
@@ -0,0 +1,158 @@
+# Copyright (c) 2016-2022 Memgraph Ltd. [https://memgraph.com]
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from unittest.mock import patch
+
+import mgclient
+import pytest
+
+from gqlalchemy.connection import MemgraphConnection, _MemgraphPool
+from gqlalchemy.exceptions import GQLAlchemyDatabaseError
+
+KEY = ("127.0.0.1", 7687, "", "", False, None, False)
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = None
+
+    def execute(self, query, parameters=None):
+        if self.connection.dead:
+            self.connection.status = mgclient.CONN_STATUS_BAD
+            raise mgclient.DatabaseError("failed to send chunk data")
+        if query == "INVALID":
+            raise mgclient.DatabaseError("line 1:1 mismatched input")
+
+    def fetchall(self):
+        return []
+
+
+class FakeConnection:
+    def __init__(self, *args, **kwargs):
+        self.status = mgclient.CONN_STATUS_READY
+        self.closed = False
+        self.dead = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+def new_memgraph_connection():
+    return MemgraphConnection("127.0.0.1", 7687, "", "", False)
+
+
+def test_connection_is_reused_after_close():
+    with patch("gqlalchemy.connection._memgraph_pool", _MemgraphPool()), patch(
+        "gqlalchemy.connection.mgclient.connect", side_effect=FakeConnection
+    ) as connect:
+        connection = new_memgraph_connection()
+        raw_connection = connection._connection
+        connection.close()
+
+        assert connection._connection is None
+        assert not raw_connection.closed
+        assert new_memgraph_connection()._connection is raw_connection
+        assert connect.call_count == 1
+
+
+def test_idle_connections_are_bounded():
+    pool = _MemgraphPool(max_idle=2)
+    connections = [FakeConnection() for _ in range(3)]
+    for connection in connections:
+        pool.release(KEY, connection, os.getpid())
+
+    assert [connection.closed for connection in connections] == [False, False, True]
+    assert pool.acquire(KEY) is connections[1]
+    assert pool.acquire(KEY) is connections[0]
+    assert pool.acquire(KEY) is None
+
+
+def test_connection_not_ready_is_discarded():
+    pool = _MemgraphPool()
+    bad_connection = FakeConnection()
+    bad_connection.status = mgclient.CONN_STATUS_BAD
+    pool.release(KEY, bad_connection, os.getpid())
+
+    assert bad_connection.closed
+    assert pool.acquire(KEY) is None
+
+    connection = FakeConnection()
+    pool.release(KEY, connection, os.getpid())
+    connection.status = mgclient.CONN_STATUS_BAD
+
+    assert pool.acquire(KEY) is None
+
+
+def test_connections_from_parent_process_are_not_reused():
+    pool = _MemgraphPool()
+    connection = FakeConnection()
+    pool.release(KEY, connection, os.getpid())
+    pool._pid = -1
+
+    assert pool.acquire(KEY) is None
+    assert not connection.closed
+
+    inherited_connection = FakeConnection()
+    pool.release(KEY, inherited_connection, -1)
+
+    assert pool.acquire(KEY) is None
+    assert not inherited_connection.closed
+
+
+def test_idle_connections_are_cleared():
+    pool = _MemgraphPool()
+    connection = FakeConnection()
+    pool.release(KEY, connection, os.getpid())
+    pool.clear(KEY)
+
+    assert connection.closed
+    assert pool.acquire(KEY) is None
+
+
+def test_dead_pooled_connection_is_replaced():
+    with patch("gqlalchemy.connection._memgraph_pool", _MemgraphPool()), patch(
+        "gqlalchemy.connection.mgclient.connect", side_effect=FakeConnection
+    ) as connect:
+        connection = new_memgraph_connection()
+        dead_connection = connection._connection
+        connection.close()
+        dead_connection.dead = True
+
+        connection = new_memgraph_connection()
+        assert connection._connection is dead_connection
+
+        connection.execute("RETURN 1;")
+
+        assert connection._connection is not dead_connection
+        assert dead_connection.closed
+        assert connect.call_count == 2
+
+
+def test_query_error_is_not_retried():
+    with patch("gqlalchemy.connection._memgraph_pool", _MemgraphPool()), patch(
+        "gqlalchemy.connection.mgclient.connect", side_effect=FakeConnection
+    ) as connect:
+        connection = new_memgraph_connection()
+        connection.close()
+        connection = new_memgraph_connection()
+
+        with pytest.raises(GQLAlchemyDatabaseError):
+            connection.execute("INVALID")
+
+        assert connect.call_count == 1
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from unittest.mock import patch
+
 from gqlalchemy.vendors.memgraph import Memgraph
 
 
@@ -23,3 +25,16 @@ def test_argument_lazy_default():
 def test_argument_lazy_false():
     memgraph = Memgraph(lazy=True)
     assert memgraph._lazy is True
+
+
+def test_argument_fetch_size_default():
+    memgraph = Memgraph()
+    assert memgraph._fetch_size == 1000
+
+
+def test_argument_fetch_size_is_passed_to_connection():
+    memgraph = Memgraph(fetch_size=10)
+    with patch("gqlalchemy.vendors.memgraph.MemgraphConnection") as connection:
+        memgraph.new_connection()
+
+    assert connection.call_args.kwargs["fetch_size"] == 10
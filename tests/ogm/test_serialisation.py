@@ -13,7 +13,7 @@
 
 import pytest
 
-from datetime import datetime
+from datetime import date, datetime, time, timedelta
 from typing import Optional
 
 from gqlalchemy import Field, Node, Relationship
@@ -50,6 +50,23 @@ def test_save_node2(database):
     assert node1.name == node2.name
 
 
+@pytest.mark.parametrize("database", ["neo4j", "memgraph"], indirect=True)
+def test_save_node_updates_node_with_unique_field(database):
+    class NodeWithKey(Node):
+        id: int = Field(unique=True, db=database)
+        name: Optional[str] = Field()
+
+    node1 = NodeWithKey(id=1, name="First NodeWithKey").save(database)
+    node2 = NodeWithKey(id=1, name="Updated NodeWithKey").save(database)
+
+    assert node2._id == node1._id
+    assert node2.name == "Updated NodeWithKey"
+
+    loaded_node = NodeWithKey(id=1).load(database)
+    assert loaded_node._id == node1._id
+    assert loaded_node.name == "Updated NodeWithKey"
+
+
 @pytest.mark.parametrize("database", ["neo4j", "memgraph"], indirect=True)
 def test_save_nodes(database):
     class SimpleNode(Node):
@@ -81,6 +98,25 @@ def test_save_nodes(database):
     assert node3.name == "3rd Simple Node"
 
 
+@pytest.mark.parametrize("database", ["neo4j", "memgraph"], indirect=True)
+def test_save_many_and_load_many(database):
+    class SimpleNode(Node):
+        id: Optional[int] = Field()
+        name: Optional[str] = Field()
+
+    nodes = SimpleNode.save_many(database, [SimpleNode(id=i, name=f"Node {i}") for i in range(5)])
+    assert all(node._id is not None for node in nodes)
+    assert len({node._id for node in nodes}) == 5
+
+    loaded_nodes = [SimpleNode() for _ in nodes]
+    for loaded_node, node in zip(loaded_nodes, nodes):
+        loaded_node._id = node._id
+
+    SimpleNode.load_many(database, loaded_nodes)
+    assert [node.id for node in loaded_nodes] == list(range(5))
+    assert [node.name for node in loaded_nodes] == [f"Node {i}" for i in range(5)]
+
+
 @pytest.mark.parametrize("database", ["neo4j", "memgraph"], indirect=True)
 def test_save_relationship(database):
     class NodeWithKey(Node):
@@ -158,6 +194,27 @@ def test_save_relationships(database):
     assert relationship2._id is not None
 
 
+@pytest.mark.parametrize("database", ["neo4j", "memgraph"], indirect=True)
+def test_relationship_save_many(database):
+    class SimpleNode(Node):
+        id: Optional[int] = Field()
+
+    class Weighted(Relationship, type="WEIGHTED"):
+        weight: Optional[int] = Field()
+
+    node1, node2 = SimpleNode.save_many(database, [SimpleNode(id=1), SimpleNode(id=2)])
+    relationships = Weighted.save_many(
+        database,
+        [Weighted(_start_node_id=node1._id, _end_node_id=node2._id, weight=weight) for weight in range(3)],
+    )
+    assert len({relationship._id for relationship in relationships}) == 3
+
+    relationships[0].weight = 10
+    Weighted.save_many(database, relationships[:1])
+    loaded = Weighted(_id=relationships[0]._id, _start_node_id=node1._id, _end_node_id=node2._id).load(database)
+    assert loaded.weight == 10
+
+
 def test_save_node_with_datetime_property(memgraph):
     class User(Node):
         id: str = Field(index=True, db=memgraph)
@@ -166,3 +223,28 @@ def test_save_node_with_datetime_property(memgraph):
 
     user = User(id="1", name="myUser", timestamp=datetime.now()).save(memgraph)
     assert user._id is not None
+
+
+def test_save_many_with_temporal_properties(memgraph):
+    class Event(Node):
+        id: int = Field()
+        at: Optional[datetime] = Field()
+        day: Optional[date] = Field()
+        starts: Optional[time] = Field()
+        duration: Optional[timedelta] = Field()
+
+    values = {
+        "at": datetime(2023, 1, 2, 3, 4, 5, 6000),
+        "day": date(2023, 1, 2),
+        "starts": time(3, 4, 5),
+        "duration": timedelta(days=1, hours=2, seconds=3),
+    }
+    saved = Event.save_many(memgraph, [Event(id=1, **values), Event(id=2, **values)])
+    single = Event(id=3, **values).save(memgraph)
+
+    loaded_nodes = [Event(id=node.id) for node in [*saved, single]]
+    for loaded_node, node in zip(loaded_nodes, [*saved, single]):
+        loaded_node._id = node._id
+
+    for node in Event.load_many(memgraph, loaded_nodes):
+        assert (node.at, node.day, node.starts, node.duration) == tuple(values.values())
@@ -1,7 +1,10 @@
+from gqlalchemy.vendors.memgraph import create_transaction
+
+
 def test_get_transactions(memgraph):
     result = memgraph.get_transactions()
     assert len(result) == 1
-    assert result[0].username == ("",)
+    assert result[0].username == ""
     assert result[0].transaction_id != ""
     assert result[0].query == ["SHOW TRANSACTIONS;"]
     assert result[0].metadata == {}
@@ -12,3 +15,10 @@ def test_terminate_transactions(memgraph):
     terminated_transactions = memgraph.terminate_transactions([result[0].transaction_id])
     assert terminated_transactions[0].killed is False
     assert terminated_transactions[0].transaction_id == result[0].transaction_id
+
+
+def test_transaction_is_hashable():
+    transaction_data = {"username": "", "transaction_id": "1", "query": ["SHOW TRANSACTIONS;"], "metadata": {}}
+    transaction = create_transaction(transaction_data)
+
+    assert {transaction} == {create_transaction(transaction_data)}
@@ -54,6 +54,14 @@ def test_add_node_property(clear_db):
     assert result_value == property_value
 
 
+def test_add_multiple_node_properties(clear_db):
+    node_id = 1
+    properties = {"person_name": "John", "person_surname": "Doe"}
+    db.save_node_properties(node_id, properties)
+    for property_name, property_value in properties.items():
+        assert db.load_node_property(node_id, property_name) == property_value
+
+
 def test_delete_node_property(clear_db):
     node_id = 1
     property_name = "person_name"
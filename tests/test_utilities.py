@@ -81,6 +81,12 @@ def test_to_cypher_datetime():
     assert to_cypher_value(zoned_dt_utc) == "datetime('2021-04-21T14:15:00Z')"
 
 
+def test_to_cypher_duration_microseconds():
+    assert to_cypher_value(datetime.timedelta(microseconds=1)) == "duration('P0DT0H0M0.000001S')"
+    assert to_cypher_value(datetime.timedelta(days=3, microseconds=123456)) == "duration('P3DT0H0M0.123456S')"
+    assert to_cypher_value(datetime.timedelta(seconds=-1)) == "duration('P-1DT23H59M59.0S')"
+
+
 def test_to_cypher_labels_single_label():
     label = "Label"
     expected_cypher_label = ":Label"